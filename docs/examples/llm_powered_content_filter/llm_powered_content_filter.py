@@ -17,7 +17,7 @@ demonstrates:
 
 import logging
 import asyncio
-from typing import Optional, Any
+import re
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, Agent, AgentSession, inference, AgentServer, cli
 from livekit.plugins import openai, silero
@@ -28,6 +28,11 @@ load_dotenv()
 logger = logging.getLogger("complex-content-filter")
 logger.setLevel(logging.INFO)
 
+SENTENCE_END_CHARS = ('.', '!', '?')
+SENTENCE_END = re.compile(r'[.!?]')
+# Greedy match up to and including the last sentence terminator in the buffer
+LAST_SENTENCE_END = re.compile(r'.*[.!?]', re.DOTALL)
+
 class ContentFilterAgent(Agent):
     def __init__(self) -> None:
         super().__init__(instructions="You are a helpful agent.")
@@ -60,46 +65,39 @@ class ContentFilterAgent(Agent):
     async def on_enter(self):
         self.session.generate_reply()
 
-    def _extract_content(self, chunk: Any) -> Optional[str]:
-        """Extract content from a chunk, handling different chunk formats."""
-        if not chunk:
-            return None
-        if isinstance(chunk, str):
-            return chunk
-        if hasattr(chunk, 'delta'):
-            return getattr(chunk.delta, 'content', None)
-        return None
-
     async def llm_node(self, chat_ctx, tools, model_settings=None):
         async def process_stream():
             buffer = ""
             chunk_buffer = []
-            sentence_end_chars = {'.', '!', '?'}
 
             async with self.session.llm.chat(chat_ctx=chat_ctx, tools=tools, tool_choice=None) as stream:
                 try:
                     async for chunk in stream:
-                        content = self._extract_content(chunk)
+                        try:
+                            content = chunk.delta.content
+                        except AttributeError:
+                            content = chunk if isinstance(chunk, str) else None
                         chunk_buffer.append(chunk)
 
                         if content:
                             buffer += content
 
-                            if any(char in buffer for char in sentence_end_chars):
-                                last_end = max(buffer.rfind(char) for char in sentence_end_chars if char in buffer)
-                                if last_end != -1:
-                                    sentence = buffer[:last_end + 1]
-                                    buffer = buffer[last_end + 1:]
+                            # Everything up to the previous terminator was already flushed,
+                            # so only the new content can introduce a sentence end
+                            if SENTENCE_END.search(content):
+                                match = LAST_SENTENCE_END.match(buffer)
+                                sentence = buffer[:match.end()]
+                                buffer = buffer[match.end():]
 
-                                    if not await self.evaluate_content(sentence):
-                                        yield "Content filtered."
-                                        return
+                                if not await self.evaluate_content(sentence):
+                                    yield "Content filtered."
+                                    return
 
-                                    for buffered_chunk in chunk_buffer:
-                                        yield buffered_chunk
-                                    chunk_buffer = []
+                                for buffered_chunk in chunk_buffer:
+                                    yield buffered_chunk
+                                chunk_buffer = []
 
-                    if buffer and any(buffer.endswith(char) for char in sentence_end_chars):
+                    if buffer and buffer.endswith(SENTENCE_END_CHARS):
                         if not await self.evaluate_content(buffer):
                             yield "Content filtered."
                             return
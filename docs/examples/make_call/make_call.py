@@ -26,43 +26,79 @@ logger.setLevel(logging.INFO)
 room_name = "my-room"
 agent_name = "test-agent"
 outbound_trunk_id = os.getenv("SIP_OUTBOUND_TRUNK_ID")
+participant_identity = "phone_user"
 
-async def make_call(phone_number):
+async def make_call(lkapi, phone_number, room_name=room_name):
     """Create a dispatch and add a SIP participant to call the phone number"""
-    lkapi = api.LiveKitAPI()
+    logger.info(f"Creating dispatch for agent {agent_name} and dialing {phone_number} to room {room_name}")
 
-    logger.info(f"Creating dispatch for agent {agent_name} in room {room_name}")
-    dispatch = await lkapi.agent_dispatch.create_dispatch(
-        api.CreateAgentDispatchRequest(
-            agent_name=agent_name, room=room_name, metadata=phone_number
+    # The dispatch and the SIP participant only share the room name, so both requests can be in flight at once
+    dispatch_task = asyncio.create_task(
+        lkapi.agent_dispatch.create_dispatch(
+            api.CreateAgentDispatchRequest(
+                agent_name=agent_name, room=room_name, metadata=phone_number
+            )
         )
     )
-    logger.info(f"Created dispatch: {dispatch}")
-
-    if not outbound_trunk_id or not outbound_trunk_id.startswith("ST_"):
-        logger.error("SIP_OUTBOUND_TRUNK_ID is not set or invalid")
-        return
-
-    logger.info(f"Dialing {phone_number} to room {room_name}")
-
-    try:
-        sip_participant = await lkapi.sip.create_sip_participant(
+    sip_task = asyncio.create_task(
+        lkapi.sip.create_sip_participant(
             api.CreateSIPParticipantRequest(
                 room_name=room_name,
                 sip_trunk_id=outbound_trunk_id,
                 sip_call_to=phone_number,
-                participant_identity="phone_user",
+                participant_identity=participant_identity,
             )
         )
+    )
+
+    try:
+        dispatch = await dispatch_task
+    except Exception as e:
+        logger.error(f"Error creating dispatch: {e}")
+        # No agent will join the room, so don't leave the callee connected to it
+        sip_task.cancel()
+        sip_participant, = await asyncio.gather(sip_task, return_exceptions=True)
+        if not isinstance(sip_participant, BaseException):
+            await hang_up(lkapi, room_name)
+        return
+    logger.info(f"Created dispatch: {dispatch}")
+
+    try:
+        sip_participant = await sip_task
         logger.info(f"Created SIP participant: {sip_participant}")
     except Exception as e:
         logger.error(f"Error creating SIP participant: {e}")
 
-    await lkapi.aclose()
+async def hang_up(lkapi, room_name):
+    """Remove the phone participant from the room, ending the call"""
+    try:
+        await lkapi.room.remove_participant(
+            api.RoomParticipantIdentity(room=room_name, identity=participant_identity)
+        )
+        logger.info(f"Hung up on {participant_identity} in room {room_name}")
+    except Exception as e:
+        logger.error(f"Error removing SIP participant: {e}")
+
+async def make_calls(phone_numbers):
+    """Dial every phone number concurrently, sharing a single API client"""
+    if not outbound_trunk_id or not outbound_trunk_id.startswith("ST_"):
+        logger.error("SIP_OUTBOUND_TRUNK_ID is not set or invalid")
+        return
+
+    async with api.LiveKitAPI() as lkapi:
+        if len(phone_numbers) == 1:
+            await make_call(lkapi, phone_numbers[0])
+            return
+
+        # Give each call its own room so the agents and callers don't end up together
+        await asyncio.gather(*[
+            make_call(lkapi, phone_number, f"{room_name}-{i}")
+            for i, phone_number in enumerate(phone_numbers)
+        ])
 
 async def main():
     phone_number = "+1231231231"
-    await make_call(phone_number)
+    await make_calls([phone_number])
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -23,15 +23,14 @@ demonstrates:
 """
 
 import logging
-import asyncio
+import queue
+import threading
+import time
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, Agent, AgentSession, inference, AgentServer, cli
 from livekit.agents.metrics import LLMMetrics
 from livekit.plugins import silero
 from rich.console import Console
-from rich.table import Table
-from rich import box
-from datetime import datetime
 
 load_dotenv()
 
@@ -39,6 +38,23 @@ logger = logging.getLogger("metrics-llm")
 logger.setLevel(logging.INFO)
 
 console = Console()
+print_queue = queue.SimpleQueue()
+
+def print_worker():
+    while True:
+        console.print(print_queue.get(), markup=False)
+
+threading.Thread(target=print_worker, daemon=True).start()
+
+LLM_METRICS_TEMPLATE = (
+    "LLM Metrics | Type: {type} | Label: {label} | Request ID: {request_id} | "
+    "Timestamp: {timestamp.tm_year}-{timestamp.tm_mon:02d}-{timestamp.tm_mday:02d} "
+    "{timestamp.tm_hour:02d}:{timestamp.tm_min:02d}:{timestamp.tm_sec:02d} | "
+    "Duration: {duration:.4f}s | Time to First Token: {ttft:.4f}s | "
+    "Cancelled: {cancelled} | Completion Tokens: {completion_tokens} | "
+    "Prompt Tokens: {prompt_tokens} | Total Tokens: {total_tokens} | "
+    "Tokens/Second: {tokens_per_second:.2f}"
+)
 
 class LLMMetricsAgent(Agent):
     def __init__(self) -> None:
@@ -49,41 +65,23 @@ class LLMMetricsAgent(Agent):
         )
 
     async def on_enter(self):
-        def sync_wrapper(metrics: LLMMetrics):
-            asyncio.create_task(self.on_metrics_collected(metrics))
-
-        self.session.llm.on("metrics_collected", sync_wrapper)
+        self.session.llm.on("metrics_collected", self.on_metrics_collected)
         self.session.generate_reply()
 
-    async def on_metrics_collected(self, metrics: LLMMetrics) -> None:
-        table = Table(
-            title="[bold blue]LLM Metrics Report[/bold blue]",
-            box=box.ROUNDED,
-            highlight=True,
-            show_header=True,
-            header_style="bold cyan"
-        )
-
-        table.add_column("Metric", style="bold green")
-        table.add_column("Value", style="yellow")
-
-        timestamp = datetime.fromtimestamp(metrics.timestamp).strftime('%Y-%m-%d %H:%M:%S')
-
-        table.add_row("Type", str(metrics.type))
-        table.add_row("Label", str(metrics.label))
-        table.add_row("Request ID", str(metrics.request_id))
-        table.add_row("Timestamp", timestamp)
-        table.add_row("Duration", f"[white]{metrics.duration:.4f}[/white]s")
-        table.add_row("Time to First Token", f"[white]{metrics.ttft:.4f}[/white]s")
-        table.add_row("Cancelled", "✓" if metrics.cancelled else "✗")
-        table.add_row("Completion Tokens", str(metrics.completion_tokens))
-        table.add_row("Prompt Tokens", str(metrics.prompt_tokens))
-        table.add_row("Total Tokens", str(metrics.total_tokens))
-        table.add_row("Tokens/Second", f"{metrics.tokens_per_second:.2f}")
-
-        console.print("\n")
-        console.print(table)
-        console.print("\n")
+    def on_metrics_collected(self, metrics: LLMMetrics) -> None:
+        print_queue.put(LLM_METRICS_TEMPLATE.format(
+            type=metrics.type,
+            label=metrics.label,
+            request_id=metrics.request_id,
+            timestamp=time.localtime(metrics.timestamp),
+            duration=metrics.duration,
+            ttft=metrics.ttft,
+            cancelled="✓" if metrics.cancelled else "✗",
+            completion_tokens=metrics.completion_tokens,
+            prompt_tokens=metrics.prompt_tokens,
+            total_tokens=metrics.total_tokens,
+            tokens_per_second=metrics.tokens_per_second,
+        ))
 
 server = AgentServer()
 
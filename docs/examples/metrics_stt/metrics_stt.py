@@ -19,15 +19,14 @@ demonstrates:
 """
 
 import logging
-import asyncio
+import queue
+import threading
+import time
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, Agent, AgentSession, inference, AgentServer, cli
 from livekit.agents.metrics import STTMetrics, EOUMetrics
 from livekit.plugins import silero
 from rich.console import Console
-from rich.table import Table
-from rich import box
-from datetime import datetime
 
 load_dotenv()
 
@@ -35,6 +34,29 @@ logger = logging.getLogger("metrics-stt")
 logger.setLevel(logging.INFO)
 
 console = Console()
+print_queue = queue.SimpleQueue()
+
+def print_worker():
+    while True:
+        console.print(print_queue.get(), markup=False)
+
+threading.Thread(target=print_worker, daemon=True).start()
+
+STT_METRICS_TEMPLATE = (
+    "STT Metrics | Type: {type} | Label: {label} | Request ID: {request_id} | "
+    "Timestamp: {timestamp.tm_year}-{timestamp.tm_mon:02d}-{timestamp.tm_mday:02d} "
+    "{timestamp.tm_hour:02d}:{timestamp.tm_min:02d}:{timestamp.tm_sec:02d} | "
+    "Duration: {duration:.4f}s | Speech ID: {speech_id} | "
+    "Error: {error} | Streamed: {streamed} | Audio Duration: {audio_duration:.4f}s"
+)
+
+EOU_METRICS_TEMPLATE = (
+    "End of Utterance Metrics | Type: {type} | Label: {label} | "
+    "Timestamp: {timestamp.tm_year}-{timestamp.tm_mon:02d}-{timestamp.tm_mday:02d} "
+    "{timestamp.tm_hour:02d}:{timestamp.tm_min:02d}:{timestamp.tm_sec:02d} | "
+    "End of Utterance Delay: {end_of_utterance_delay:.4f}s | "
+    "Transcription Delay: {transcription_delay:.4f}s | Speech ID: {speech_id} | Error: {error}"
+)
 
 class STTMetricsAgent(Agent):
     def __init__(self) -> None:
@@ -45,69 +67,33 @@ class STTMetricsAgent(Agent):
         )
 
     async def on_enter(self):
-        def stt_wrapper(metrics: STTMetrics):
-            asyncio.create_task(self.on_stt_metrics_collected(metrics))
-
-        def eou_wrapper(metrics: EOUMetrics):
-            asyncio.create_task(self.on_eou_metrics_collected(metrics))
-
-        self.session.stt.on("metrics_collected", stt_wrapper)
-        self.session.stt.on("eou_metrics_collected", eou_wrapper)
+        self.session.stt.on("metrics_collected", self.on_stt_metrics_collected)
+        self.session.stt.on("eou_metrics_collected", self.on_eou_metrics_collected)
         self.session.generate_reply()
 
-    async def on_stt_metrics_collected(self, metrics: STTMetrics) -> None:
-        table = Table(
-            title="[bold blue]STT Metrics Report[/bold blue]",
-            box=box.ROUNDED,
-            highlight=True,
-            show_header=True,
-            header_style="bold cyan"
-        )
-
-        table.add_column("Metric", style="bold green")
-        table.add_column("Value", style="yellow")
-
-        timestamp = datetime.fromtimestamp(metrics.timestamp).strftime('%Y-%m-%d %H:%M:%S')
-
-        table.add_row("Type", str(metrics.type))
-        table.add_row("Label", str(metrics.label))
-        table.add_row("Request ID", str(metrics.request_id))
-        table.add_row("Timestamp", timestamp)
-        table.add_row("Duration", f"[white]{metrics.duration:.4f}[/white]s")
-        table.add_row("Speech ID", str(metrics.speech_id))
-        table.add_row("Error", str(metrics.error))
-        table.add_row("Streamed", "✓" if metrics.streamed else "✗")
-        table.add_row("Audio Duration", f"[white]{metrics.audio_duration:.4f}[/white]s")
-
-        console.print("\n")
-        console.print(table)
-        console.print("\n")
-
-    async def on_eou_metrics_collected(self, metrics: EOUMetrics) -> None:
-        table = Table(
-            title="[bold blue]End of Utterance Metrics Report[/bold blue]",
-            box=box.ROUNDED,
-            highlight=True,
-            show_header=True,
-            header_style="bold cyan"
-        )
-
-        table.add_column("Metric", style="bold green")
-        table.add_column("Value", style="yellow")
-
-        timestamp = datetime.fromtimestamp(metrics.timestamp).strftime('%Y-%m-%d %H:%M:%S')
-
-        table.add_row("Type", str(metrics.type))
-        table.add_row("Label", str(metrics.label))
-        table.add_row("Timestamp", timestamp)
-        table.add_row("End of Utterance Delay", f"[white]{metrics.end_of_utterance_delay:.4f}[/white]s")
-        table.add_row("Transcription Delay", f"[white]{metrics.transcription_delay:.4f}[/white]s")
-        table.add_row("Speech ID", str(metrics.speech_id))
-        table.add_row("Error", str(metrics.error))
-
-        console.print("\n")
-        console.print(table)
-        console.print("\n")
+    def on_stt_metrics_collected(self, metrics: STTMetrics) -> None:
+        print_queue.put(STT_METRICS_TEMPLATE.format(
+            type=metrics.type,
+            label=metrics.label,
+            request_id=metrics.request_id,
+            timestamp=time.localtime(metrics.timestamp),
+            duration=metrics.duration,
+            speech_id=metrics.speech_id,
+            error=metrics.error,
+            streamed="✓" if metrics.streamed else "✗",
+            audio_duration=metrics.audio_duration,
+        ))
+
+    def on_eou_metrics_collected(self, metrics: EOUMetrics) -> None:
+        print_queue.put(EOU_METRICS_TEMPLATE.format(
+            type=metrics.type,
+            label=metrics.label,
+            timestamp=time.localtime(metrics.timestamp),
+            end_of_utterance_delay=metrics.end_of_utterance_delay,
+            transcription_delay=metrics.transcription_delay,
+            speech_id=metrics.speech_id,
+            error=metrics.error,
+        ))
 
 server = AgentServer()
 
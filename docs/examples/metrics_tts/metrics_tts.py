@@ -19,15 +19,14 @@ demonstrates:
 ---
 """
 import logging
-import asyncio
+import queue
+import threading
+import time
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, AgentServer, cli, Agent, AgentSession, inference
 from livekit.agents.metrics import TTSMetrics
 from livekit.plugins import silero
 from rich.console import Console
-from rich.table import Table
-from rich import box
-from datetime import datetime
 
 load_dotenv()
 
@@ -35,6 +34,23 @@ logger = logging.getLogger("metrics-tts")
 logger.setLevel(logging.INFO)
 
 console = Console()
+print_queue = queue.SimpleQueue()
+
+def print_worker():
+    while True:
+        console.print(print_queue.get(), markup=False)
+
+threading.Thread(target=print_worker, daemon=True).start()
+
+TTS_METRICS_TEMPLATE = (
+    "TTS Metrics | Type: {type} | Label: {label} | Request ID: {request_id} | "
+    "Timestamp: {timestamp.tm_year}-{timestamp.tm_mon:02d}-{timestamp.tm_mday:02d} "
+    "{timestamp.tm_hour:02d}:{timestamp.tm_min:02d}:{timestamp.tm_sec:02d} | "
+    "TTFB: {ttfb:.4f}s | Duration: {duration:.4f}s | "
+    "Audio Duration: {audio_duration:.4f}s | Cancelled: {cancelled} | "
+    "Characters Count: {characters_count} | Streamed: {streamed} | "
+    "Speech ID: {speech_id} | Error: {error}"
+)
 
 class TTSMetricsAgent(Agent):
     def __init__(self) -> None:
@@ -45,36 +61,21 @@ class TTSMetricsAgent(Agent):
     async def on_enter(self):
         self.session.generate_reply()
 
-async def display_tts_metrics(metrics: TTSMetrics):
-    table = Table(
-        title="[bold blue]TTS Metrics Report[/bold blue]",
-        box=box.ROUNDED,
-        highlight=True,
-        show_header=True,
-        header_style="bold cyan"
-    )
-
-    table.add_column("Metric", style="bold green")
-    table.add_column("Value", style="yellow")
-
-    timestamp = datetime.fromtimestamp(metrics.timestamp).strftime('%Y-%m-%d %H:%M:%S')
-
-    table.add_row("Type", str(metrics.type))
-    table.add_row("Label", str(metrics.label))
-    table.add_row("Request ID", str(metrics.request_id))
-    table.add_row("Timestamp", timestamp)
-    table.add_row("TTFB", f"[white]{metrics.ttfb:.4f}[/white]s")
-    table.add_row("Duration", f"[white]{metrics.duration:.4f}[/white]s")
-    table.add_row("Audio Duration", f"[white]{metrics.audio_duration:.4f}[/white]s")
-    table.add_row("Cancelled", "✓" if metrics.cancelled else "✗")
-    table.add_row("Characters Count", str(metrics.characters_count))
-    table.add_row("Streamed", "✓" if metrics.streamed else "✗")
-    table.add_row("Speech ID", str(metrics.speech_id))
-    table.add_row("Error", str(metrics.error))
-
-    console.print("\n")
-    console.print(table)
-    console.print("\n")
+def display_tts_metrics(metrics: TTSMetrics):
+    print_queue.put(TTS_METRICS_TEMPLATE.format(
+        type=metrics.type,
+        label=metrics.label,
+        request_id=metrics.request_id,
+        timestamp=time.localtime(metrics.timestamp),
+        ttfb=metrics.ttfb,
+        duration=metrics.duration,
+        audio_duration=metrics.audio_duration,
+        cancelled="✓" if metrics.cancelled else "✗",
+        characters_count=metrics.characters_count,
+        streamed="✓" if metrics.streamed else "✗",
+        speech_id=metrics.speech_id,
+        error=metrics.error,
+    ))
 
 server = AgentServer()
 
@@ -89,10 +90,7 @@ async def entrypoint(ctx: JobContext):
 
     tts_instance = inference.TTS(model="cartesia/sonic-3", voice="9626c31c-bec5-4cca-baa8-f8ba9e84c8bc")
 
-    def on_tts_metrics(metrics: TTSMetrics):
-        asyncio.create_task(display_tts_metrics(metrics))
-
-    tts_instance.on("metrics_collected", on_tts_metrics)
+    tts_instance.on("metrics_collected", display_tts_metrics)
 
     session = AgentSession(
         stt=inference.STT(model="deepgram/nova-3-general"),
@@ -16,14 +16,13 @@ demonstrates:
 ---
 """
 import logging
-import asyncio
+import queue
+import threading
+import time
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, AgentServer, cli, Agent, AgentSession, inference, vad
 from livekit.plugins import silero
 from rich.console import Console
-from rich.table import Table
-from rich import box
-from datetime import datetime
 
 load_dotenv()
 
@@ -31,6 +30,22 @@ logger = logging.getLogger("metrics-vad")
 logger.setLevel(logging.INFO)
 
 console = Console()
+print_queue = queue.SimpleQueue()
+
+def print_worker():
+    while True:
+        console.print(print_queue.get(), markup=False)
+
+threading.Thread(target=print_worker, daemon=True).start()
+
+VAD_METRICS_TEMPLATE = (
+    "VAD Event Metrics | Type: {type} | "
+    "Timestamp: {timestamp.tm_year}-{timestamp.tm_mon:02d}-{timestamp.tm_mday:02d} "
+    "{timestamp.tm_hour:02d}:{timestamp.tm_min:02d}:{timestamp.tm_sec:02d} | "
+    "Idle Time: {idle_time:.4f}s | "
+    "Inference Duration Total: {inference_duration_total:.4f}s | "
+    "Inference Count: {inference_count} | Speech ID: {speech_id} | Error: {error}"
+)
 
 class VADMetricsAgent(Agent):
     def __init__(self) -> None:
@@ -38,31 +53,16 @@ class VADMetricsAgent(Agent):
             instructions="You are a helpful agent."
         )
 
-async def display_vad_metrics(event: vad.VADEvent):
-    table = Table(
-        title="[bold blue]VAD Event Metrics Report[/bold blue]",
-        box=box.ROUNDED,
-        highlight=True,
-        show_header=True,
-        header_style="bold cyan"
-    )
-
-    table.add_column("Metric", style="bold green")
-    table.add_column("Value", style="yellow")
-
-    timestamp = datetime.fromtimestamp(event.timestamp).strftime('%Y-%m-%d %H:%M:%S')
-
-    table.add_row("Type", str(event.type))
-    table.add_row("Timestamp", timestamp)
-    table.add_row("Idle Time", f"[white]{event.idle_time:.4f}[/white]s")
-    table.add_row("Inference Duration Total", f"[white]{event.inference_duration_total:.4f}[/white]s")
-    table.add_row("Inference Count", str(event.inference_count))
-    table.add_row("Speech ID", str(event.speech_id))
-    table.add_row("Error", str(event.error))
-
-    console.print("\n")
-    console.print(table)
-    console.print("\n")
+def display_vad_metrics(event: vad.VADEvent):
+    print_queue.put(VAD_METRICS_TEMPLATE.format(
+        type=event.type,
+        timestamp=time.localtime(event.timestamp),
+        idle_time=event.idle_time,
+        inference_duration_total=event.inference_duration_total,
+        inference_count=event.inference_count,
+        speech_id=event.speech_id,
+        error=event.error,
+    ))
 
 server = AgentServer()
 
@@ -77,10 +77,7 @@ async def entrypoint(ctx: JobContext):
 
     vad_instance = ctx.proc.userdata["vad"]
 
-    def on_vad_event(event: vad.VADEvent):
-        asyncio.create_task(display_vad_metrics(event))
-
-    vad_instance.on("metrics_collected", on_vad_event)
+    vad_instance.on("metrics_collected", display_vad_metrics)
 
     session = AgentSession(
         stt=inference.STT(model="deepgram/nova-3-general"),
@@ -13,6 +13,7 @@ demonstrates:
 import asyncio
 import logging
 import os
+import time
 from dotenv import load_dotenv
 from PIL import Image
 import moondream as md
@@ -27,12 +28,17 @@ load_dotenv()
 logger = logging.getLogger("vision-agent")
 logger.setLevel(logging.INFO)
 
+# Minimum number of seconds between frames sent to Moondream
+CAPTION_INTERVAL = 1.0
+
 class VisionAgent(Agent):
-    def __init__(self) -> None:
-        self._latest_frame = None
+    def __init__(self, md_model) -> None:
+        self._latest_caption = None
+        self._last_caption_ts = 0.0
+        self._caption_task = None
         self._video_stream = None
-        self._tasks = []
-        self._md_model = md.vl(api_key=os.getenv("MOONDREAM_API_KEY"))
+        self._tasks = set()
+        self._md_model = md_model
         super().__init__(
             instructions="""
                 You are an assistant communicating through voice with vision capabilities.
@@ -61,10 +67,14 @@ class VisionAgent(Agent):
     def _send_frame_to_moondream(self, frame: rtc.VideoFrame) -> str | None:
         try:
             rgb_frame = frame.convert(proto_video.VideoBufferType.RGB24)
-            image = Image.frombytes(
+            image = Image.frombuffer(
                 "RGB",
                 (rgb_frame.width, rgb_frame.height),
-                rgb_frame.data.tobytes(),
+                rgb_frame.data,
+                "raw",
+                "RGB",
+                0,
+                1,
             )
             caption = self._md_model.caption(image).get("caption")
             if caption:
@@ -74,12 +84,15 @@ class VisionAgent(Agent):
             logger.error("Error sending frame to Moondream: %s", exc)
             return None
 
+    async def _caption_frame(self, frame: rtc.VideoFrame) -> None:
+        caption = await asyncio.to_thread(self._send_frame_to_moondream, frame)
+        if caption:
+            self._latest_caption = caption
+
     async def on_user_turn_completed(self, turn_ctx: ChatContext, new_message: ChatMessage) -> None:
-        if self._latest_frame:
-            caption = self._send_frame_to_moondream(self._latest_frame)
-            if caption:
-                new_message.content.append(f"[Image description: {caption}]")
-            self._latest_frame = None
+        if self._latest_caption:
+            new_message.content.append(f"[Image description: {self._latest_caption}]")
+            self._latest_caption = None
 
     def _create_video_stream(self, track: rtc.Track):
         if self._video_stream is not None:
@@ -88,16 +101,23 @@ class VisionAgent(Agent):
         self._video_stream = rtc.VideoStream(track)
         async def read_stream():
             async for event in self._video_stream:
-                self._latest_frame = event.frame
+                now = time.monotonic()
+                if now - self._last_caption_ts < CAPTION_INTERVAL:
+                    continue
+                if self._caption_task is not None and not self._caption_task.done():
+                    continue
+                self._last_caption_ts = now
+                self._caption_task = asyncio.create_task(self._caption_frame(event.frame))
 
         task = asyncio.create_task(read_stream())
-        task.add_done_callback(lambda t: self._tasks.remove(t))
-        self._tasks.append(task)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
 server = AgentServer()
 
 def prewarm(proc: JobProcess):
     proc.userdata["vad"] = silero.VAD.load()
+    proc.userdata["md"] = md.vl(api_key=os.getenv("MOONDREAM_API_KEY"))
 
 server.setup_fnc = prewarm
 
@@ -113,7 +133,7 @@ async def entrypoint(ctx: JobContext):
         preemptive_generation=True,
     )
 
-    await session.start(agent=VisionAgent(), room=ctx.room)
+    await session.start(agent=VisionAgent(md_model=ctx.proc.userdata["md"]), room=ctx.room)
     await ctx.connect()
 
 if __name__ == "__main__":
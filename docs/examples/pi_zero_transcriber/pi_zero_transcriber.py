@@ -11,6 +11,7 @@ demonstrates:
 ---
 """
 
+import asyncio
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, AgentServer, cli, Agent, AgentSession, inference
 from livekit.plugins import deepgram
@@ -20,12 +21,15 @@ from PIL import ImageDraw
 from PIL import ImageFont
 import st7789
 import textwrap
+import queue
+import threading
 
 load_dotenv()
 
 SPI_SPEED_MHZ = 20
+SCREEN_ROTATION = 90
 screen = st7789.ST7789(
-    rotation=90,
+    rotation=SCREEN_ROTATION,
     port=0,
     cs=1,
     dc=9,
@@ -41,28 +45,72 @@ draw = ImageDraw.Draw(image)
 font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
 title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 22)
 
+TEXT_TOP = 50
+LINE_HEIGHT = 20
+MAX_LINES = 9
+
+wrapper = textwrap.TextWrapper(width=26)
+
+# Lines currently drawn on the panel, or None when the transcription view needs a full redraw
+displayed_lines = None
+
 def show_startup_screen():
+    global displayed_lines
+    displayed_lines = None
+
     draw.rectangle((0, 0, width, height), fill=(0, 0, 0))
     draw.text((10, 10), "LiveKit", font=title_font, fill=(255, 255, 255))
     draw.text((10, 40), "Transcription", font=title_font, fill=(255, 255, 255))
     draw.text((10, 80), "Starting...", font=font, fill=(200, 200, 200))
     screen.display(image)
 
-def display_transcription(text):
-    draw.rectangle((0, 0, width, height), fill=(0, 0, 0))
-    draw.text((10, 10), "Transcription", font=title_font, fill=(255, 255, 255))
+def display_rows(y0, y1):
+    """Send only rows y0..y1 of the image to the display instead of the full frame."""
+    # With a 90 degree rotation the panel is scanned sideways, so image rows map to panel columns
+    screen.set_window(y0, 0, y1 - 1, width - 1)
+    pixelbytes = screen.image_to_data(image.crop((0, y0, width, y1)), SCREEN_ROTATION)
+    for i in range(0, len(pixelbytes), 4096):
+        screen.data(pixelbytes[i:i + 4096])
 
-    y_position = 50
-    wrapped_text = textwrap.wrap(text, width=26)
+def append_wrapped(lines, text):
+    """Wrap text onto the end of already wrapped lines, re-flowing only the last line."""
+    if not lines:
+        return wrapper.wrap(text)
+    return lines[:-1] + wrapper.wrap(lines[-1] + " " + text)
 
-    max_lines = 9
-    display_lines = wrapped_text[-max_lines:] if len(wrapped_text) > max_lines else wrapped_text
+def display_transcription(wrapped_lines):
+    global displayed_lines
 
-    for line in display_lines:
-        draw.text((10, y_position), line, font=font, fill=(200, 200, 200))
-        y_position += 20
+    display_lines = wrapped_lines[-MAX_LINES:]
+    display_lines += [""] * (MAX_LINES - len(display_lines))
 
-    screen.display(image)
+    if displayed_lines is None:
+        draw.rectangle((0, 0, width, height), fill=(0, 0, 0))
+        draw.text((10, 10), "Transcription", font=title_font, fill=(255, 255, 255))
+        for i, line in enumerate(display_lines):
+            draw.text((10, TEXT_TOP + i * LINE_HEIGHT), line, font=font, fill=(200, 200, 200))
+        screen.display(image)
+        displayed_lines = display_lines
+        return
+
+    changed = [i for i, line in enumerate(display_lines) if line != displayed_lines[i]]
+    if not changed:
+        return
+
+    for i in changed:
+        y_position = TEXT_TOP + i * LINE_HEIGHT
+        draw.rectangle((0, y_position, width, y_position + LINE_HEIGHT), fill=(0, 0, 0))
+        draw.text((10, y_position), display_lines[i], font=font, fill=(200, 200, 200))
+
+    display_rows(TEXT_TOP + changed[0] * LINE_HEIGHT, TEXT_TOP + (changed[-1] + 1) * LINE_HEIGHT)
+    displayed_lines = display_lines
+
+def write_log(log_queue):
+    with open("user_speech_log.txt", "a") as f:
+        while (line := log_queue.get()) is not None:
+            f.write(line)
+            if log_queue.empty():
+                f.flush()
 
 server = AgentServer()
 
@@ -70,8 +118,17 @@ server = AgentServer()
 async def entrypoint(ctx: JobContext):
     show_startup_screen()
 
-    current_transcript = ""
-    last_transcript = ""
+    final_lines = []
+
+    log_queue = queue.SimpleQueue()
+    log_thread = threading.Thread(target=write_log, args=(log_queue,), daemon=True)
+    log_thread.start()
+
+    async def stop_log_writer():
+        log_queue.put(None)
+        await asyncio.to_thread(log_thread.join)
+
+    ctx.add_shutdown_callback(stop_log_writer)
 
     session = AgentSession(
         stt=deepgram.STT(),
@@ -79,22 +136,17 @@ async def entrypoint(ctx: JobContext):
 
     @session.on("user_input_transcribed")
     def on_transcript(transcript):
-        nonlocal current_transcript, last_transcript
+        nonlocal final_lines
 
         if transcript.is_final:
-            current_transcript += " " + transcript.transcript
-            current_transcript = current_transcript.strip()
-
-            with open("user_speech_log.txt", "a") as f:
-                f.write(f"{transcript.transcript}\n")
+            # Earlier lines never re-flow, so only the visible tail needs to be kept
+            final_lines = append_wrapped(final_lines, transcript.transcript)[-MAX_LINES:]
+            log_queue.put(f"{transcript.transcript}\n")
+            display_transcription(final_lines)
+        elif transcript.transcript:
+            display_transcription(append_wrapped(final_lines, transcript.transcript))
         else:
-            last_transcript = transcript.transcript
-
-        display_text = current_transcript
-        if not transcript.is_final and last_transcript:
-            display_text += " " + last_transcript
-
-        display_transcription(display_text)
+            display_transcription(final_lines)
 
     await session.start(
         agent=Agent(
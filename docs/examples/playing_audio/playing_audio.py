@@ -22,6 +22,26 @@ load_dotenv()
 logger = logging.getLogger("playing-audio")
 logger.setLevel(logging.INFO)
 
+def load_audio_frame(audio_path: Path) -> rtc.AudioFrame:
+    with wave.open(str(audio_path), 'rb') as wav_file:
+        num_channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        num_frames = wav_file.getnframes()
+        frames = wav_file.readframes(num_frames)
+
+    return rtc.AudioFrame(
+        data=frames,
+        sample_rate=sample_rate,
+        num_channels=num_channels,
+        samples_per_channel=num_frames
+    )
+
+# The file never changes, so decode it once instead of on every tool call
+AUDIO_FRAME = load_audio_frame(Path(__file__).parent / "audio.wav")
+
+async def single_frame(frame: rtc.AudioFrame):
+    yield frame
+
 class AudioPlayerAgent(Agent):
     def __init__(self) -> None:
         super().__init__(
@@ -34,24 +54,7 @@ class AudioPlayerAgent(Agent):
     @function_tool
     async def play_audio_file(self, context: RunContext):
         """Play a local audio file"""
-        audio_path = Path(__file__).parent / "audio.wav"
-
-        with wave.open(str(audio_path), 'rb') as wav_file:
-            num_channels = wav_file.getnchannels()
-            sample_rate = wav_file.getframerate()
-            frames = wav_file.readframes(wav_file.getnframes())
-
-        audio_frame = rtc.AudioFrame(
-            data=frames,
-            sample_rate=sample_rate,
-            num_channels=num_channels,
-            samples_per_channel=wav_file.getnframes()
-        )
-
-        async def audio_generator():
-            yield audio_frame
-
-        await self.session.say("Playing audio file", audio=audio_generator())
+        await self.session.say("Playing audio file", audio=single_frame(AUDIO_FRAME))
 
         return None, "I've played the audio file for you."
 
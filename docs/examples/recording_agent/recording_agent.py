@@ -10,6 +10,7 @@ demonstrates:
 ---
 """
 
+import asyncio
 import logging
 from dotenv import load_dotenv
 from livekit import api
@@ -36,6 +37,13 @@ server = AgentServer()
 
 def prewarm(proc: JobProcess):
     proc.userdata["vad"] = silero.VAD.load()
+    # Replace this placeholder with the path to your GCP service account credentials JSON
+    try:
+        with open("/path/to/credentials.json", "r") as f:
+            proc.userdata["gcp_credentials"] = f.read()
+    except OSError as exc:
+        logger.error(f"Could not read GCP credentials, recording is disabled: {exc}")
+        proc.userdata["gcp_credentials"] = None
 
 server.setup_fnc = prewarm
 
@@ -43,9 +51,9 @@ server.setup_fnc = prewarm
 async def entrypoint(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name}
 
-    file_contents = ""
-    with open("/path/to/credentials.json", "r") as f:
-        file_contents = f.read()
+    if ctx.proc.userdata["gcp_credentials"] is None:
+        logger.error("No GCP credentials loaded, not starting a recording session")
+        return
 
     req = api.RoomCompositeEgressRequest(
         room_name="my-room",
@@ -58,14 +66,11 @@ async def entrypoint(ctx: JobContext):
             live_playlist_name="my-live-playlist.m3u8",
             segment_duration=5,
             gcp=api.GCPUpload(
-                credentials=file_contents,
+                credentials=ctx.proc.userdata["gcp_credentials"],
                 bucket="<my-bucket>",
             ),
         )],
     )
-    lkapi = api.LiveKitAPI()
-    res = await lkapi.egress.start_room_composite_egress(req)
-
     session = AgentSession(
         stt=inference.STT(model="deepgram/nova-3-general"),
         llm=inference.LLM(model="openai/gpt-5-mini"),
@@ -74,10 +79,18 @@ async def entrypoint(ctx: JobContext):
         preemptive_generation=True,
     )
 
-    await session.start(agent=RecordingAgent(), room=ctx.room)
-    await ctx.connect()
-
-    await lkapi.aclose()
+    lkapi = api.LiveKitAPI()
+    # Egress doesn't depend on the agent's session, so start it while the session comes up
+    egress_task = asyncio.create_task(lkapi.egress.start_room_composite_egress(req))
+    try:
+        await session.start(agent=RecordingAgent(), room=ctx.room)
+        await ctx.connect()
+        await egress_task
+    finally:
+        # If startup failed, stop the egress request before its client is closed
+        egress_task.cancel()
+        await asyncio.gather(egress_task, return_exceptions=True)
+        await lkapi.aclose()
 
 if __name__ == "__main__":
     cli.run_app(server)
@@ -8,6 +8,7 @@ description: Shows how to create an agent that can repeat what the user says.
 demonstrates:
   - Using the `on_user_input_transcribed` event to listen to the user's input
   - Using the `say` method to respond to the user with the same input
+  - Keeping echoed speech out of the chat history with `add_to_chat_ctx=False`
 ---
 """
 from dotenv import load_dotenv
@@ -38,7 +39,7 @@ async def entrypoint(ctx: JobContext):
     @session.on("user_input_transcribed")
     def on_transcript(transcript):
         if transcript.is_final:
-            session.say(transcript.transcript)
+            session.say(transcript.transcript, add_to_chat_ctx=False)
 
     await session.start(
         agent=Agent(
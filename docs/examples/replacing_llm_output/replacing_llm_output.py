@@ -15,6 +15,7 @@ demonstrates:
 """
 
 import logging
+import re
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, AgentServer, cli, Agent, AgentSession
 from livekit.plugins import openai, deepgram, silero
@@ -24,39 +25,69 @@ load_dotenv()
 logger = logging.getLogger("replacing-llm-output")
 logger.setLevel(logging.INFO)
 
+# Built once per process so every session reuses the same Groq HTTP client and its connections
+GROQ_LLM = openai.LLM.with_groq(model="deepseek-r1-distill-llama-70b")
+
+THINK_TAG = re.compile(r'</?think>')
+THINK_TAG_REPLACEMENTS = {"<think>": "", "</think>": "Okay, I'm ready to respond."}
+
+def split_partial_tag(text: str) -> tuple[str, str]:
+    """Split off a trailing fragment that could still grow into a think tag in the next chunk."""
+    start = text.rfind('<')
+    if start != -1 and any(tag.startswith(text[start:]) and tag != text[start:] for tag in THINK_TAG_REPLACEMENTS):
+        return text[:start], text[start:]
+    return text, ""
+
 class SimpleAgent(Agent):
     def __init__(self) -> None:
         super().__init__(
             instructions="You are a helpful agent."
         )
-        self._llm = openai.LLM.with_groq(model="deepseek-r1-distill-llama-70b")
+        self._llm = GROQ_LLM
 
     async def on_enter(self):
         self.session.generate_reply()
 
     async def llm_node(self, chat_ctx, tools, model_settings=None):
         async def process_stream():
+            carry = ""
             async with self._llm.chat(chat_ctx=chat_ctx, tools=tools, tool_choice=None) as stream:
                 async for chunk in stream:
                     if chunk is None:
                         continue
 
-                    content = getattr(chunk.delta, 'content', None) if hasattr(chunk, 'delta') else str(chunk)
+                    try:
+                        delta = chunk.delta
+                    except AttributeError:
+                        delta = None
+                        content = str(chunk)
+                    else:
+                        content = delta.content if delta is not None else None
                     if content is None:
                         yield chunk
                         continue
 
-                    processed_content = content.replace("<think>", "").replace("</think>", "Okay, I'm ready to respond.")
-                    print(f"Original: {content}, Processed: {processed_content}")
+                    if not carry and '<' not in content:
+                        yield chunk
+                        continue
+
+                    # Tags can straddle chunks (e.g. "<thi" + "nk>"), so hold back an incomplete one
+                    stable, carry = split_partial_tag(carry + content)
+                    processed_content = THINK_TAG.sub(lambda m: THINK_TAG_REPLACEMENTS[m.group(0)], stable)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Original: %s, Processed: %s", content, processed_content)
 
                     if processed_content != content:
-                        if hasattr(chunk, 'delta') and hasattr(chunk.delta, 'content'):
-                            chunk.delta.content = processed_content
+                        if delta is not None:
+                            delta.content = processed_content
                         else:
                             chunk = processed_content
 
                     yield chunk
 
+            if carry:
+                yield carry
+
         return process_stream()
 
 server = AgentServer()
@@ -28,11 +28,29 @@ class SayPhraseInVoiceAgent(Agent):
             instructions="You are an agent that can say phrases in different voices."
         )
         self._tts = inworld.TTS(voice="Ashley")
+        # One client per extra voice so switching never reconfigures the session's TTS
+        self._tts_pool = {}
 
     async def say_phrase_in_voice(self, phrase, voice="Hades"):
-        self._tts.update_options(voice=voice)
-        await self.session.say(phrase)
-        self._tts.update_options(voice="Ashley")
+        if voice == "Ashley":
+            await self.session.say(phrase)
+            return
+
+        tts = self._tts_pool.get(voice)
+        if tts is None:
+            tts = self._tts_pool[voice] = inworld.TTS(voice=voice)
+
+        async def audio_generator():
+            async with tts.synthesize(phrase) as stream:
+                async for audio in stream:
+                    yield audio.frame
+
+        await self.session.say(phrase, audio=audio_generator())
+
+    async def aclose_tts_pool(self):
+        for tts in self._tts_pool.values():
+            await tts.aclose()
+        self._tts_pool.clear()
 
     @function_tool
     async def say_phrase_in_voice_tool(self, phrase: str, voice: str = "Ashley"):
@@ -54,6 +72,7 @@ async def entrypoint(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name}
 
     agent = SayPhraseInVoiceAgent()
+    ctx.add_shutdown_callback(agent.aclose_tts_pool)
 
     session = AgentSession(
         stt=inference.STT(model="deepgram/nova-3-general"),
@@ -4,7 +4,7 @@ title: Short Replies Only
 category: pipeline-tts
 tags: [pipeline-tts, openai, deepgram, rime]
 difficulty: beginner
-description: Shows how to override the default TTS node to only respond with short replies based on the number of chunks.
+description: Shows how to override the default TTS node to only respond with short replies based on the number of sentences.
 demonstrates:
   - Using the `tts_node` method to override the default TTS node and add custom logic to only respond with short replies.
   - Using the `session.interrupt` method to interrupt the agent if it's taking too long to respond, and then informing the user with `session.say`
@@ -12,6 +12,7 @@ demonstrates:
 """
 from typing import AsyncIterable
 import logging
+import re
 from dotenv import load_dotenv
 from livekit.agents import AgentServer, AgentSession, JobContext, JobProcess, cli, Agent, inference, ModelSettings
 from livekit.plugins import silero
@@ -21,6 +22,25 @@ load_dotenv()
 logger = logging.getLogger("tts_node")
 logger.setLevel(logging.INFO)
 
+SENTENCE_END = re.compile(r'[.!?]\s+|\n+')
+
+async def split_sentences(text: AsyncIterable[str]):
+    """Group streamed chunks into whole sentences so the TTS synthesizes them in one go.
+
+    Whitespace-only segments such as paragraph breaks are dropped so they don't count as sentences.
+    """
+    buffer = ""
+    async for chunk in text:
+        buffer += chunk
+        while (match := SENTENCE_END.search(buffer)) is not None:
+            sentence = buffer[:match.end()]
+            buffer = buffer[match.end():]
+            if not sentence.isspace():
+                yield sentence
+
+    if buffer and not buffer.isspace():
+        yield buffer
+
 class ShortRepliesOnlyAgent(Agent):
     def __init__(self) -> None:
         super().__init__(
@@ -30,23 +50,22 @@ class ShortRepliesOnlyAgent(Agent):
         )
 
     async def tts_node(self, text: AsyncIterable[str], model_settings: ModelSettings):
-        MAX_CHUNKS = 20
-        chunk_count = 0
+        MAX_SENTENCES = 2
 
         async def process_text():
-            nonlocal chunk_count
-            interrupted = False
-            async for chunk in text:
-                chunk_count += 1
-                if chunk_count > MAX_CHUNKS and not interrupted:
-                    logger.info(f"tts_node: Exceeded {MAX_CHUNKS} chunks. Interrupting.")
-                    self.session.interrupt()
-                    self.session.say("I'm sorry, that will take too long to say.")
-                    interrupted = True
-                    break
-
-                if not interrupted:
-                    yield chunk
+            sentences = split_sentences(text)
+            for _ in range(MAX_SENTENCES):
+                sentence = await anext(sentences, None)
+                if sentence is None:
+                    return
+                yield sentence
+
+            # Only look for an extra sentence once the allowed ones have been forwarded
+            if await anext(sentences, None) is not None:
+                logger.info(f"tts_node: Exceeded {MAX_SENTENCES} sentences. Interrupting.")
+                self.session.interrupt()
+                self.session.say("I'm sorry, that will take too long to say.")
+            await sentences.aclose()
 
         return Agent.default.tts_node(self, process_text(), model_settings)
 
@@ -15,6 +15,7 @@ demonstrates:
 """
 
 import logging
+import re
 from dotenv import load_dotenv
 from livekit.agents import AgentServer, AgentSession, JobContext, JobProcess, cli, Agent, inference
 from livekit.plugins import silero
@@ -24,6 +25,12 @@ load_dotenv()
 logger = logging.getLogger("simple-content-filter")
 logger.setLevel(logging.INFO)
 
+OFFENSIVE_TERMS = ['fail']
+# One alternation pattern scans each chunk once for every term instead of looping over the list
+OFFENSIVE_PATTERN = re.compile('|'.join(map(re.escape, OFFENSIVE_TERMS)), re.IGNORECASE)
+# Characters that can start a term; chunks containing none of them can't match and skip the regex
+OFFENSIVE_FIRST_CHARS = frozenset(c for term in OFFENSIVE_TERMS for c in (term[0].lower(), term[0].upper()))
+
 class SimpleAgent(Agent):
     def __init__(self) -> None:
         super().__init__(
@@ -44,14 +51,23 @@ class SimpleAgent(Agent):
                     if chunk is None:
                         continue
 
-                    content = getattr(chunk.delta, 'content', None) if hasattr(chunk, 'delta') else str(chunk)
+                    try:
+                        delta = chunk.delta
+                    except AttributeError:
+                        content = str(chunk)
+                    else:
+                        content = delta.content if delta is not None else None
                     if content is None:
                         yield chunk
                         continue
 
-                    offensive_terms = ['fail']
-                    print(content)
-                    yield "CONTENT FILTERED" if any(term in content.lower() for term in offensive_terms) else chunk
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("LLM chunk: %s", content)
+                    if OFFENSIVE_FIRST_CHARS.isdisjoint(content):
+                        yield chunk
+                        continue
+
+                    yield "CONTENT FILTERED" if OFFENSIVE_PATTERN.search(content) else chunk
 
         return process_stream()
 
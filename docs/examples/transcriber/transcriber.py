@@ -11,18 +11,60 @@ demonstrates:
 ---
 """
 
-import datetime
+import asyncio
+import queue
+import threading
+import time
+from datetime import datetime
 from dotenv import load_dotenv
 from livekit.agents import JobContext, AgentServer, cli, Agent, AgentSession, inference
 
 load_dotenv()
 
+now = datetime.now
+
+# Batch log lines and write them out at most every FLUSH_INTERVAL seconds or once FLUSH_SIZE bytes pile up
+FLUSH_INTERVAL = 0.5
+FLUSH_SIZE = 4096
+
+def write_log(log_queue):
+    buffer = bytearray()
+    last_flush = time.monotonic()
+    with open("user_speech_log.txt", "ab") as f:
+        while True:
+            try:
+                line = log_queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                line = ""
+            if line is None:
+                break
+
+            buffer += line.encode()
+            if buffer and (len(buffer) >= FLUSH_SIZE or time.monotonic() - last_flush >= FLUSH_INTERVAL):
+                # The buffered writer writes the whole batch, and flush pushes it to the file in one go
+                f.write(buffer)
+                f.flush()
+                buffer.clear()
+                last_flush = time.monotonic()
+
+        f.write(buffer)
+
 server = AgentServer()
 
 @server.rtc_session()
 async def entrypoint(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name}
 
+    log_queue = queue.SimpleQueue()
+    log_thread = threading.Thread(target=write_log, args=(log_queue,), daemon=True)
+    log_thread.start()
+
+    async def stop_log_writer():
+        log_queue.put(None)
+        await asyncio.to_thread(log_thread.join)
+
+    ctx.add_shutdown_callback(stop_log_writer)
+
     session = AgentSession(
         stt=inference.STT(model="deepgram/nova-3-general"),
     )
@@ -30,9 +72,8 @@ async def entrypoint(ctx: JobContext):
     @session.on("user_input_transcribed")
     def on_transcript(transcript):
         if transcript.is_final:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open("user_speech_log.txt", "a") as f:
-                f.write(f"[{timestamp}] {transcript.transcript}\n")
+            timestamp = now().isoformat(sep=" ", timespec="seconds")
+            log_queue.put(f"[{timestamp}] {transcript.transcript}\n")
 
     await session.start(
         agent=Agent(instructions="You are a helpful assistant that transcribes user speech to text."),
@@ -15,6 +15,7 @@ demonstrates:
 """
 
 import logging
+import re
 from typing import AsyncIterable
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, AgentServer, cli, Agent, AgentSession, inference, ModelSettings
@@ -25,6 +26,20 @@ load_dotenv()
 logger = logging.getLogger("transcription-node")
 logger.setLevel(logging.INFO)
 
+REPLACEMENTS = {
+    "hello": "👋 HELLO",
+    "goodbye": "GOODBYE 👋",
+}
+REPLACEMENT_PATTERN = re.compile(r"\b(" + "|".join(map(re.escape, REPLACEMENTS)) + r")\b", re.IGNORECASE)
+REPLACEMENT_FIRST_CHARS = frozenset(c for word in REPLACEMENTS for c in (word[0].lower(), word[0].upper()))
+
+def replace_word(match: re.Match) -> str:
+    word = match.group(0)
+    replacement = REPLACEMENTS[word.lower()]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Replacing %r with %r in transcript", word, replacement)
+    return replacement
+
 class TranscriptionModifierAgent(Agent):
     def __init__(self) -> None:
         super().__init__(
@@ -38,26 +53,17 @@ class TranscriptionModifierAgent(Agent):
 
     async def transcription_node(self, text: AsyncIterable[str], model_settings: ModelSettings):
         """Modify the transcription output by replacing certain words."""
-        replacements = {
-            "hello": "👋 HELLO",
-            "goodbye": "GOODBYE 👋",
-        }
-
         async def process_text():
             async for chunk in text:
-                modified_chunk = chunk
-                original_chunk = chunk
-
-                for word, replacement in replacements.items():
-                    if word in modified_chunk.lower() or word.capitalize() in modified_chunk:
-                        logger.info(f"Replacing '{word}' with '{replacement}' in transcript")
+                if REPLACEMENT_FIRST_CHARS.isdisjoint(chunk):
+                    yield chunk
+                    continue
 
-                    modified_chunk = modified_chunk.replace(word, replacement)
-                    modified_chunk = modified_chunk.replace(word.capitalize(), replacement)
+                modified_chunk = REPLACEMENT_PATTERN.sub(replace_word, chunk)
 
-                if original_chunk != modified_chunk:
-                    logger.info(f"Original: '{original_chunk}'")
-                    logger.info(f"Modified: '{modified_chunk}'")
+                if logger.isEnabledFor(logging.INFO) and modified_chunk != chunk:
+                    logger.info("Original: %r", chunk)
+                    logger.info("Modified: %r", modified_chunk)
 
                 yield modified_chunk
 
@@ -7,7 +7,7 @@ difficulty: intermediate
 description: Switches between different TTS providers using function tools.
 demonstrates:
   - Using function tools to switch between different TTS providers.
-  - Each function tool returns a new agent with the same instructions, but with a different TTS provider.
+  - Each function tool returns an agent with the same instructions, but with a different TTS provider, created on first use and reused afterwards.
 ---
 """
 
@@ -22,7 +22,7 @@ logger.setLevel(logging.INFO)
 load_dotenv()
 
 class RimeAgent(Agent):
-    def __init__(self, vad) -> None:
+    def __init__(self, agents: dict[str, Agent]) -> None:
         super().__init__(
             instructions="""
                 You are a helpful assistant communicating through voice.
@@ -30,12 +30,9 @@ class RimeAgent(Agent):
                 You can switch to a different TTS provider if asked.
                 Don't use any unpronouncable characters.
             """,
-            stt=deepgram.STT(),
-            llm=openai.LLM(),
             tts=rime.TTS(),
-            vad=vad
         )
-        self._vad = vad
+        self._agents = agents
 
     async def on_enter(self) -> None:
         await self.session.say("Hello! I'm now using the Rime TTS voice. How does it sound?")
@@ -43,21 +40,21 @@ class RimeAgent(Agent):
     @function_tool
     async def switch_to_elevenlabs(self):
         """Switch to ElevenLabs TTS voice"""
-        return ElevenLabsAgent(self._vad)
+        return get_agent(self._agents, "elevenlabs")
 
     @function_tool
     async def switch_to_cartesia(self):
         """Switch to Cartesia TTS voice"""
-        return CartesiaAgent(self._vad)
+        return get_agent(self._agents, "cartesia")
 
     @function_tool
     async def switch_to_playai(self):
         """Switch to PlayAI TTS voice"""
-        return PlayAIAgent(self._vad)
+        return get_agent(self._agents, "playai")
 
 
 class ElevenLabsAgent(Agent):
-    def __init__(self, vad) -> None:
+    def __init__(self, agents: dict[str, Agent]) -> None:
         super().__init__(
             instructions="""
                 You are a helpful assistant communicating through voice.
@@ -65,12 +62,9 @@ class ElevenLabsAgent(Agent):
                 You can switch to a different TTS provider if asked.
                 Don't use any unpronouncable characters.
             """,
-            stt=deepgram.STT(),
-            llm=openai.LLM(),
             tts=elevenlabs.TTS(),
-            vad=vad
         )
-        self._vad = vad
+        self._agents = agents
 
     async def on_enter(self) -> None:
         await self.session.say("Hello! I'm now using the ElevenLabs TTS voice. What do you think of how I sound?")
@@ -78,21 +72,21 @@ class ElevenLabsAgent(Agent):
     @function_tool
     async def switch_to_rime(self):
         """Switch to Rime TTS voice"""
-        return RimeAgent(self._vad)
+        return get_agent(self._agents, "rime")
 
     @function_tool
     async def switch_to_cartesia(self):
         """Switch to Cartesia TTS voice"""
-        return CartesiaAgent(self._vad)
+        return get_agent(self._agents, "cartesia")
 
     @function_tool
     async def switch_to_playai(self):
         """Switch to PlayAI TTS voice"""
-        return PlayAIAgent(self._vad)
+        return get_agent(self._agents, "playai")
 
 
 class CartesiaAgent(Agent):
-    def __init__(self, vad) -> None:
+    def __init__(self, agents: dict[str, Agent]) -> None:
         super().__init__(
             instructions="""
                 You are a helpful assistant communicating through voice.
@@ -100,12 +94,9 @@ class CartesiaAgent(Agent):
                 You can switch to a different TTS provider if asked.
                 Don't use any unpronouncable characters.
             """,
-            stt=deepgram.STT(),
-            llm=openai.LLM(),
             tts=cartesia.TTS(),
-            vad=vad
         )
-        self._vad = vad
+        self._agents = agents
 
     async def on_enter(self) -> None:
         await self.session.say("Hello! I'm now using the Cartesia TTS voice. How do I sound to you?")
@@ -113,21 +104,21 @@ class CartesiaAgent(Agent):
     @function_tool
     async def switch_to_rime(self):
         """Switch to Rime TTS voice"""
-        return RimeAgent(self._vad)
+        return get_agent(self._agents, "rime")
 
     @function_tool
     async def switch_to_elevenlabs(self):
         """Switch to ElevenLabs TTS voice"""
-        return ElevenLabsAgent(self._vad)
+        return get_agent(self._agents, "elevenlabs")
 
     @function_tool
     async def switch_to_playai(self):
         """Switch to PlayAI TTS voice"""
-        return PlayAIAgent(self._vad)
+        return get_agent(self._agents, "playai")
 
 
 class PlayAIAgent(Agent):
-    def __init__(self, vad) -> None:
+    def __init__(self, agents: dict[str, Agent]) -> None:
         super().__init__(
             instructions="""
                 You are a helpful assistant communicating through voice.
@@ -135,12 +126,9 @@ class PlayAIAgent(Agent):
                 You can switch to a different TTS provider if asked.
                 Don't use any unpronouncable characters.
             """,
-            stt=deepgram.STT(),
-            llm=openai.LLM(),
             tts=playai.TTS(),
-            vad=vad
         )
-        self._vad = vad
+        self._agents = agents
 
     async def on_enter(self) -> None:
         await self.session.say("Hello! I'm now using the PlayAI TTS voice. What are your thoughts on how I sound?")
@@ -148,17 +136,32 @@ class PlayAIAgent(Agent):
     @function_tool
     async def switch_to_rime(self):
         """Switch to Rime TTS voice"""
-        return RimeAgent(self._vad)
+        return get_agent(self._agents, "rime")
 
     @function_tool
     async def switch_to_elevenlabs(self):
         """Switch to ElevenLabs TTS voice"""
-        return ElevenLabsAgent(self._vad)
+        return get_agent(self._agents, "elevenlabs")
 
     @function_tool
     async def switch_to_cartesia(self):
         """Switch to Cartesia TTS voice"""
-        return CartesiaAgent(self._vad)
+        return get_agent(self._agents, "cartesia")
+
+
+AGENT_CLASSES: dict[str, type[Agent]] = {
+    "rime": RimeAgent,
+    "elevenlabs": ElevenLabsAgent,
+    "cartesia": CartesiaAgent,
+    "playai": PlayAIAgent,
+}
+
+def get_agent(agents: dict[str, Agent], name: str) -> Agent:
+    """Return the session's agent for a provider, creating it on first use so only its API key is needed."""
+    agent = agents.get(name)
+    if agent is None:
+        agent = agents[name] = AGENT_CLASSES[name](agents)
+    return agent
 
 
 server = AgentServer()
@@ -172,10 +175,18 @@ server.setup_fnc = prewarm
 async def entrypoint(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name}
 
-    session = AgentSession()
+    # Only the TTS differs between agents, so STT, LLM, and VAD live on the session and survive every switch
+    session = AgentSession(
+        stt=deepgram.STT(),
+        llm=openai.LLM(),
+        vad=ctx.proc.userdata["vad"],
+    )
+
+    # Agents are created on first switch and reused after that, keeping their warm TTS clients
+    agents: dict[str, Agent] = {}
 
     await session.start(
-        agent=RimeAgent(vad=ctx.proc.userdata["vad"]),
+        agent=get_agent(agents, "rime"),
         room=ctx.room
     )
     await ctx.connect()
@@ -11,6 +11,7 @@ demonstrates:
 """
 
 import logging
+import re
 from typing import AsyncIterable
 from dotenv import load_dotenv
 from livekit.agents import JobContext, JobProcess, AgentServer, cli, Agent, AgentSession, ModelSettings
@@ -21,6 +22,8 @@ load_dotenv()
 logger = logging.getLogger("tts_node")
 logger.setLevel(logging.INFO)
 
+LAUGH_PATTERN = re.compile(r"lol", re.IGNORECASE)
+
 class TtsNodeOverrideAgent(Agent):
     def __init__(self, vad) -> None:
         super().__init__(
@@ -39,11 +42,10 @@ class TtsNodeOverrideAgent(Agent):
 
         async def process_text():
             async for chunk in text:
-                original_chunk = chunk
-                modified_chunk = chunk.replace("lol", "<laugh>").replace("LOL", "<laugh>")
+                modified_chunk, replacements = LAUGH_PATTERN.subn("<laugh>", chunk)
 
-                if original_chunk != modified_chunk:
-                    logger.info(f"TTS original: '{original_chunk}'")
+                if replacements:
+                    logger.info(f"TTS original: '{chunk}'")
                     logger.info(f"TTS modified: '{modified_chunk}'")
 
                 yield modified_chunk
@@ -25,6 +25,17 @@ logger.setLevel(logging.INFO)
 
 load_dotenv()
 
+rng = random.Random()
+
+async def _random_number() -> int:
+    num = rng.randrange(101)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("random_number called: %d", num)
+    return num
+
+# The tool is stateless, so wrap it once at import instead of on every session
+RANDOM_NUMBER_TOOL = function_tool(_random_number, name="random_number", description="Get a random number")
+
 class AddFunctionAgent(Agent):
     def __init__(self) -> None:
         super().__init__(
@@ -62,15 +73,7 @@ async def entrypoint(ctx: JobContext):
     )
     agent = AddFunctionAgent()
 
-    async def _random_number() -> int:
-        num = random.randint(0, 100)
-        logger.info(f"random_number called: {num}")
-        return num
-
-    await agent.update_tools(
-        agent.tools
-        + [function_tool(_random_number, name="random_number", description="Get a random number")]
-    )
+    await agent.update_tools([*agent.tools, RANDOM_NUMBER_TOOL])
 
     await session.start(agent=agent, room=ctx.room)
     await ctx.connect()
@@ -1,39 +1,65 @@
 #!/usr/bin/env python3
 """Generate an index of example docs with YAML frontmatter."""
 
+import argparse
+import json
 import os
 import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
-def extract_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
-    """Extract YAML frontmatter from page.mdoc or Python module docstring."""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+MDOC_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*", re.DOTALL)
+PY_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*$", re.MULTILINE | re.DOTALL)
+MAX_READ_WORKERS = 16
+SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", "env", ".env", "tests"}
+
+def read_file(file_path: Path) -> Optional[str]:
+    """Read a file's text, or None if it can't be read."""
     try:
-        content = file_path.read_text(encoding="utf-8")
+        return file_path.read_text(encoding="utf-8")
     except Exception as exc:
         print(f"Error reading file {file_path}: {exc}")
         return None
 
+def find_frontmatter(file_path: Path, content: str) -> Optional[str]:
+    """Return the raw YAML frontmatter from page.mdoc or Python module docstring content."""
     if file_path.suffix == ".mdoc":
-        fm_match = re.match(r"^---\s*\n(.*?)\n---\s*", content, re.DOTALL)
+        fm_match = MDOC_FRONTMATTER_RE.match(content)
         if not fm_match:
             return None
-        fm_body = fm_match.group(1)
+        return fm_match.group(1)
     elif file_path.suffix == ".py":
-        docstring_match = re.match(r'^\s*("""|\'\'\')(.*?)\1', content, re.DOTALL)
-        if not docstring_match:
+        stripped = content.lstrip()
+        quote = stripped[:3]
+        if quote != '"""' and quote != "'''":
+            return None
+        end = stripped.find(quote, 3)
+        if end == -1:
             return None
-        docstring_content = docstring_match.group(2)
-        fm_match = re.search(r"^---\s*\n(.*?)\n---\s*$", docstring_content, re.MULTILINE | re.DOTALL)
+        docstring_content = stripped[3:end]
+        fm_match = PY_FRONTMATTER_RE.search(docstring_content)
         if not fm_match:
             return None
-        fm_body = fm_match.group(1)
+        return fm_match.group(1)
     else:
         return None
 
+def parse_frontmatter(file_path: Path, fm_body: str) -> Optional[Dict[str, Any]]:
+    """Parse raw frontmatter into a metadata mapping."""
     try:
-        metadata = yaml.safe_load(fm_body)
+        metadata = yaml.load(fm_body, Loader=SafeLoader)
         if not isinstance(metadata, dict):
             print(f"Frontmatter in {file_path} is not a mapping, skipping.")
             return None
@@ -42,53 +68,129 @@ def extract_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
         print(f"Error parsing YAML in {file_path}: {exc}")
         return None
 
-def scan_page_docs(root_path: Path) -> List[Dict[str, Any]]:
-    """Scan docs/examples for page.mdoc frontmatter."""
+def extract_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Extract YAML frontmatter from page.mdoc or Python module docstring."""
+    content = read_file(file_path)
+    if content is None:
+        return None
+    fm_body = find_frontmatter(file_path, content)
+    if fm_body is None:
+        return None
+    return parse_frontmatter(file_path, fm_body)
+
+def iter_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield files under root, files in a directory before its subdirectories, skipping SKIP_DIRS."""
+    subdirs: List[str] = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir():
+                if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                yield entry
+    for subdir in subdirs:
+        yield from iter_files(subdir)
+
+def load_cache(cache_path: Path) -> Dict[str, Any]:
+    """Load frontmatter found by a previous run, or an empty cache."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(cache_path: Path, cache: Dict[str, Any]):
+    """Write the frontmatter cache for the next run, replacing the old one only once it is complete."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        print(f"Error writing cache {cache_path}: {exc}")
+
+def cached_frontmatter(file_path: Path, old_cache: Dict[str, Any], new_cache: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return frontmatter for file_path, skipping the read if the file is unchanged.
+
+    The cache holds the raw YAML rather than the parsed metadata, so values JSON can't represent
+    (such as dates) still come out of yaml.load with the same types as on a fresh run.
+    """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return extract_frontmatter(file_path)
+
+    key = str(file_path)
+    cached = old_cache.get(key)
+    if cached and cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+        fm_body = cached.get("fm_body")
+    else:
+        content = read_file(file_path)
+        if content is None:
+            return None
+        fm_body = find_frontmatter(file_path, content)
+    new_cache[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "fm_body": fm_body}
+    return parse_frontmatter(file_path, fm_body) if fm_body is not None else None
+
+def collect_entries(
+    file_paths: List[Path],
+    relative_to: Path,
+    old_cache: Dict[str, Any],
+    new_cache: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Read frontmatter from the given files in parallel, keeping their order."""
     entries: List[Dict[str, Any]] = []
-    skip_dirs = {".git", "__pycache__", "node_modules", ".venv", "venv", "env", ".env", "tests"}
-
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
-        for filename in filenames:
-            if filename != "page.mdoc":
-                continue
-            file_path = Path(dirpath) / filename
-            metadata = extract_frontmatter(file_path)
+    with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+        results = executor.map(lambda file_path: cached_frontmatter(file_path, old_cache, new_cache), file_paths)
+        for file_path, metadata in zip(file_paths, results):
             if metadata:
-                relative_path = file_path.relative_to(root_path)
+                relative_path = file_path.relative_to(relative_to)
                 entries.append({"file_path": str(relative_path), **metadata})
                 print(f"✓ Found frontmatter in: {relative_path}")
     return entries
 
+def scan_page_docs(root_path: Path, old_cache: Dict[str, Any], new_cache: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Scan docs/examples for page.mdoc frontmatter."""
+    if not root_path.exists():
+        return []
+
+    file_paths = [Path(entry.path) for entry in iter_files(root_path) if entry.name == "page.mdoc"]
+    return collect_entries(file_paths, root_path, old_cache, new_cache)
 
-def scan_complex_agents(root_path: Path, base_path: Path) -> List[Dict[str, Any]]:
-    """Scan complex-agents for Python files with docstring frontmatter."""
-    entries: List[Dict[str, Any]] = []
-    skip_dirs = {".git", "__pycache__", "node_modules", ".venv", "venv", "env", ".env", "tests"}
 
+def scan_complex_agents(
+    root_path: Path,
+    base_path: Path,
+    old_cache: Dict[str, Any],
+    new_cache: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Scan complex-agents for Python files with docstring frontmatter."""
     if not root_path.exists():
-        return entries
-
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
-        for filename in filenames:
-            if not filename.endswith(".py") or filename.startswith("test_"):
-                continue
-            file_path = Path(dirpath) / filename
-            metadata = extract_frontmatter(file_path)
-            if metadata:
-                relative_path = file_path.relative_to(base_path)
-                entries.append({"file_path": str(relative_path), **metadata})
-                print(f"✓ Found frontmatter in: {relative_path}")
-    return entries
+        return []
+
+    file_paths = [
+        Path(entry.path)
+        for entry in iter_files(root_path)
+        if entry.name.endswith(".py") and not entry.name.startswith("test_")
+    ]
+    return collect_entries(file_paths, base_path, old_cache, new_cache)
+
+def write_json(output_path: Path, index_data: Dict[str, Any]):
+    """Write the index as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(index_data, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(index_data, f, indent=2, ensure_ascii=False, default=str)
 
-def generate_index(base_path: Path, output_path: Path):
+def generate_index(base_path: Path, output_path: Path, cache_path: Optional[Path] = None):
     """
     Generate index.yaml file containing all frontmatter data.
 
     Args:
         base_path: Repository root
-        output_path: Path where the index should be written
+        output_path: Path where the index should be written, as JSON if it ends in .json
+        cache_path: Optional JSON file for reusing frontmatter of unchanged files between runs
     """
     docs_examples = base_path / "docs" / "examples"
     complex_agents = base_path / "complex-agents"
@@ -97,9 +199,15 @@ def generate_index(base_path: Path, output_path: Path):
     print(f"Scanning for complex agent Python files in: {complex_agents}")
     print("-" * 60)
 
+    old_cache = load_cache(cache_path) if cache_path else {}
+    new_cache: Dict[str, Any] = {}
+
     entries = []
-    entries.extend(scan_page_docs(docs_examples))
-    entries.extend(scan_complex_agents(complex_agents, base_path))
+    entries.extend(scan_page_docs(docs_examples, old_cache, new_cache))
+    entries.extend(scan_complex_agents(complex_agents, base_path, old_cache, new_cache))
+
+    if cache_path:
+        save_cache(cache_path, new_cache)
 
     if not entries:
         print("\nNo files with frontmatter found!")
@@ -107,15 +215,21 @@ def generate_index(base_path: Path, output_path: Path):
 
     entries.sort(key=lambda x: (x.get("category", ""), x.get("title", "")))
 
-    index_data = {
+    header = {
         "version": "1.0",
         "description": "Index of all LiveKit Agent examples with metadata",
         "total_examples": len(entries),
-        "examples": entries,
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        yaml.dump(index_data, f, default_flow_style=False, sort_keys=False, width=120)
+    if output_path.suffix == ".json":
+        write_json(output_path, {**header, "examples": entries})
+    else:
+        # Dump the examples one at a time rather than building a single document for the whole index
+        with open(output_path, "w", encoding="utf-8") as f:
+            yaml.dump(header, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, width=120)
+            f.write("examples:\n")
+            for entry in entries:
+                yaml.dump([entry], f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, width=120)
 
     print("\n" + "-" * 60)
     print(f"✅ Successfully generated index with {len(entries)} examples")
@@ -131,9 +245,14 @@ def generate_index(base_path: Path, output_path: Path):
         print(f"  - {category}: {count}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--json", action="store_true", help="write docs/index.json instead of docs/index.yaml")
+    args = parser.parse_args()
+
     script_path = Path(__file__).resolve()
     repo_root = script_path.parents[2]
     docs_dir = script_path.parents[1]
-    output_file = docs_dir / "index.yaml"
+    output_file = docs_dir / ("index.json" if args.json else "index.yaml")
+    cache_file = docs_dir / ".index_cache.json"
 
-    generate_index(repo_root, output_file)
+    generate_index(repo_root, output_file, cache_file)